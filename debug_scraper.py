@@ -1,5 +1,8 @@
+import shutil
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.parser import HTMLParser
 
 # Use a strong User-Agent to look like a real browser
 headers = {
@@ -8,22 +11,29 @@ headers = {
     'Referer': 'https://www.google.com/'
 }
 
+# Pooled session: keep-alive reuses the TCP/TLS connection across requests
+session = requests.Session()
+session.headers.update(headers)
+adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                      max_retries=Retry(total=3, backoff_factor=0.3))
+session.mount('https://', adapter)
+
 url = 'https://www2.hm.com/tr_tr/kadin/urunler/elbiseler.html'
 
 print(f"🕵️ Inspecting: {url}")
-response = requests.get(url, headers=headers)
-print(f"Status Code: {response.status_code}")
-
-# Save the HTML so you can read it
-with open("hm_debug.html", "w", encoding="utf-8") as f:
-    f.write(response.text)
+# Stream the raw bytes straight to disk (no decode/encode round trip)
+with session.get(url, stream=True) as response, open("hm_debug.html", "wb") as f:
+    print(f"Status Code: {response.status_code}")
+    response.raw.decode_content = True  # Undo gzip/br transfer encoding
+    shutil.copyfileobj(response.raw, f)
 
 print("✅ Saved HTML to 'hm_debug.html'. Open this file in your browser or code editor!")
 
 # Quick check for product elements
-soup = BeautifulSoup(response.text, 'html.parser')
-products = soup.select('article') # Try generic tag
+with open("hm_debug.html", "rb") as f:
+    tree = HTMLParser(f.read())  # C (Modest) parser, read-only CSS queries
+products = tree.css('article') # Try generic tag
 print(f"Found {len(products)} 'article' tags.")
 
-prices = soup.select('.price') # Try generic class
+prices = tree.css('.price') # Try generic class
 print(f"Found {len(prices)} items with class '.price'.")
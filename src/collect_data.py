@@ -1,46 +1,115 @@
-import sqlite3
-from hm_scraper import HMScraper
+import asyncio
+import logging
+from hm_scraper import BrowserPool, HMScraper, price_summary
 from currency_converter import CurrencyConverter
-from database import DB_PATH, init_db
+from database import get_connection, init_db
 
-def save_data(data_list):
-    conn = sqlite3.connect(DB_PATH)
+log = logging.getLogger(__name__)
+
+# 100 rows x 5 columns stays under SQLite's 999 bound-parameter limit
+INSERT_CHUNK_ROWS = 100
+
+# Products handed to the writer at a time while a region is still scraping
+WRITE_BATCH_ROWS = 50
+
+def insert_rows(c, statement, rows):
+    # Multi-row VALUES: one statement per chunk instead of one step per row
+    for start in range(0, len(rows), INSERT_CHUNK_ROWS):
+        chunk = rows[start:start + INSERT_CHUNK_ROWS]
+        row_placeholder = "(" + ", ".join(["?"] * len(chunk[0])) + ")"
+        placeholders = ", ".join([row_placeholder] * len(chunk))
+        c.execute(f"{statement} VALUES {placeholders}", [value for row in chunk for value in row])
+
+def save_data(data_list, conn=None, converter=None):
+    own_conn = conn is None
+    if own_conn:
+        conn = get_connection(isolation_level=None)
     c = conn.cursor()
-    converter = CurrencyConverter()
+    if converter is None:
+        converter = CurrencyConverter()
 
-    for item in data_list:
-        # 1. Insert Product if not exists
-        c.execute('''
-            INSERT OR IGNORE INTO products (article_code, name, category)
-            VALUES (?, ?, ?)
-        ''', (item['article_code'], item['name'], 'Dresses'))
-
-        # 2. Convert Price to USD
-        usd_price = converter.convert_to_usd(item['price'], item['currency'])
-
-        # 3. Insert Price Record
-        c.execute('''
-            INSERT INTO prices (article_code, region, price_original, currency, price_in_usd)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (item['article_code'], item['region'], item['price'], item['currency'], usd_price))
+    # 1. Build all rows up front (product rows + USD-normalized price rows)
+    products_rows = [(i['product_code'], i['product_name'], 'Dresses') for i in data_list]
+    price_rows = [
+        (i['product_code'], i['region_code'], i['price_local'], i['currency'],
+         converter.convert_to_usd(i['price_local'], i['currency']))
+        for i in data_list
+    ]
+
+    # 2. Insert everything in a single transaction (one fsync instead of one per row)
+    try:
+        c.execute("BEGIN IMMEDIATE")
+        insert_rows(c, "INSERT OR IGNORE INTO products (article_code, name, category)",
+                    products_rows)
+        insert_rows(c, "INSERT INTO prices (article_code, region, price_original, currency, price_in_usd)",
+                    price_rows)
+        c.execute("COMMIT")
+    except Exception:
+        # BEGIN IMMEDIATE itself can fail (SQLITE_BUSY); don't mask that
+        if conn.in_transaction:
+            c.execute("ROLLBACK")
+        raise
+    finally:
+        if own_conn:
+            conn.close()
+    log.info("✅ Saved %d items to database.", len(data_list))
+
+async def scrape_into_queue(region, queue, pool):
+    # Regions are awaited concurrently, so their page loads overlap;
+    # products are queued in batches so saving overlaps scraping too
+    scraper = HMScraper(region_code=region)
+    products = []
+    batch = []
+    async for product in scraper.iter_region(pool=pool):
+        batch.append(product)
+        if len(batch) >= WRITE_BATCH_ROWS:
+            await queue.put(batch)
+            products.extend(batch)
+            batch = []
+    if batch:
+        await queue.put(batch)
+        products.extend(batch)
+    if not products:
+        print(f"⚠️ No data found for {region}")
+        return
     
-    conn.commit()
-    conn.close()
-    print(f"✅ Saved {len(data_list)} items to database.")
+    summary = price_summary(products)
+    log.info("📊 %s: %d products, %.2f-%.2f %s (mean %.2f), %d discounted (avg %.1f%% off)",
+             region, summary['count'], summary['min_price'], summary['max_price'],
+             scraper.currency, summary['mean_price'], summary['discounted'],
+             summary['mean_discount'])
+
+async def write_from_queue(conn, queue, converter):
+    # Single writer: batches are committed as regions finish, never concurrently
+    loop = asyncio.get_running_loop()
+    while (batch := await queue.get()) is not None:
+        await loop.run_in_executor(None, save_data, batch, conn, converter)
+
+async def collect(target_regions):
+    # One shared connection; the writer uses it from worker threads
+    conn = get_connection(check_same_thread=False, isolation_level=None)
+    # FX rates are loaded once per run, not once per saved batch
+    converter = CurrencyConverter()
+    queue = asyncio.Queue()
+    writer = asyncio.create_task(write_from_queue(conn, queue, converter))
+    try:
+        # One browser per region; each region reuses one context for all its categories
+        async with BrowserPool(pool_size=len(target_regions)) as pool:
+            await asyncio.gather(
+                *[scrape_into_queue(region, queue, pool) for region in target_regions]
+            )
+    finally:
+        await queue.put(None)
+        await writer
+        conn.close()
 
 def main():
     init_db()
-    scraper = HMScraper()
     
     # Define which regions to scrape
-    target_regions = ['tr', 'us', 'de', 'gb']
+    target_regions = ['tr', 'us', 'de', 'uk']
     
-    for region in target_regions:
-        data = scraper.scrape_region(region)
-        if data:
-            save_data(data)
-        else:
-            print(f"⚠️ No data found for {region}")
+    asyncio.run(collect(target_regions))
 
 if __name__ == "__main__":
     main()
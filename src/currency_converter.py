@@ -1,9 +1,16 @@
-from forex_python.converter import CurrencyRates
+import httpx
 import datetime
+import json
+import os
+import time
+
+FX_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'fx_cache.json')
+FX_API_URL = 'https://api.exchangerate.host/latest'
+# After a failed fetch, fallback rates are reused this long before retrying
+FX_FALLBACK_TTL = 3600
 
 class CurrencyConverter:
     def __init__(self):
-        self.c = CurrencyRates()
         # Fallback rates in case API fails (Approximate values)
         self.fallback_rates = {
             'TRY': 0.028,  # 1 TRY = 0.028 USD
@@ -12,14 +19,49 @@ class CurrencyConverter:
             'SEK': 0.096,  # 1 SEK = 0.096 USD
             'USD': 1.0
         }
+        self.rates = {}
+        self.fetch_rates()
 
-    def convert_to_usd(self, amount, currency):
-        if currency == 'USD':
-            return amount
+    def fetch_rates(self):
+        # Rates update daily, so one lookup per currency per day is enough
+        today = datetime.date.today().isoformat()
+        try:
+            with open(FX_CACHE_PATH) as f:
+                cached = json.load(f)
+            fresh = not cached.get('fallback') or time.time() - cached['fetched_at'] < FX_FALLBACK_TTL
+            if cached.get('date') == today and fresh:
+                self.rates = cached['rates']
+                return self.rates
+        except (OSError, ValueError, KeyError):
+            pass
+
+        # One request for all currencies; the API quotes units per 1 USD
         try:
-            # Try live rate
-            rate = self.c.get_rate(currency, 'USD')
-            return amount * rate
-        except:
-            # Use fallback if offline
-            return amount * self.fallback_rates.get(currency, 0)
+            r = httpx.get(FX_API_URL, params={'base': 'USD', 'symbols': 'TRY,EUR,GBP,SEK'}, timeout=3.0)
+            r.raise_for_status()
+            quoted = r.json()['rates']
+            rates = {currency: 1 / quoted[currency] for currency in ('TRY', 'EUR', 'GBP', 'SEK')}
+            rates['USD'] = 1.0
+            fallback = False
+        except (httpx.HTTPError, KeyError, TypeError, ValueError, ZeroDivisionError):
+            # Offline or API refused (e.g. {"success": false}): use fallback
+            # rates and cache them briefly so later converters don't retry
+            rates = dict(self.fallback_rates)
+            fallback = True
+        self.rates = rates
+
+        try:
+            os.makedirs(os.path.dirname(FX_CACHE_PATH), exist_ok=True)
+            with open(FX_CACHE_PATH, 'w') as f:
+                json.dump({'date': today, 'rates': rates, 'fallback': fallback,
+                           'fetched_at': time.time()}, f)
+        except OSError:
+            pass
+        return self.rates
+
+    def convert_to_usd(self, amount, currency):
+        # Plain dict lookups only; no API call or exception handling per conversion
+        rate = self.rates.get(currency)
+        if rate is None:
+            rate = self.fallback_rates.get(currency, 0)
+        return amount * rate
@@ -1,32 +1,40 @@
 import streamlit as st
 import pandas as pd
-import sqlite3
 import plotly.express as px
-from database import DB_PATH
+from database import get_connection
 
 st.set_page_config(page_title="H&M Global Strategy", layout="wide")
 
+# Widget interactions rerun the script; serve the frames from memory for 5 minutes
+@st.cache_data(ttl=300)
 def load_data():
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_connection(isolation_level=None)
+    # Aggregate in SQLite so only one row per region comes back
+    avg_query = """
+        SELECT region, AVG(price_in_usd) AS price_in_usd
+        FROM prices
+        GROUP BY region
+    """
+    # Only the cheapest rows are ever looked at, so cap the table
     query = """
         SELECT p.name, p.article_code, pr.region, pr.price_original, pr.currency, pr.price_in_usd, pr.date_scraped
         FROM prices pr
         JOIN products p ON pr.article_code = p.article_code
+        ORDER BY pr.price_in_usd ASC
+        LIMIT 500
     """
+    avg_price = pd.read_sql(avg_query, conn)
     df = pd.read_sql(query, conn)
     conn.close()
-    return df
+    return df, avg_price
 
 st.title("🌍 H&M Global Price Intelligence Tracker")
 st.markdown("Comparing real-time pricing strategies across Turkey, US, and EU.")
 
 try:
-    df = load_data()
+    df, avg_price = load_data()
     
     if not df.empty:
-        # Key Metrics
-        avg_price = df.groupby('region')['price_in_usd'].mean().reset_index()
-        
         col1, col2 = st.columns(2)
         
         with col1:
@@ -36,7 +44,7 @@ try:
             
         with col2:
             st.subheader("Arbitrage Opportunities")
-            st.dataframe(df[['name', 'region', 'price_original', 'currency', 'price_in_usd']].sort_values(by='price_in_usd'))
+            st.dataframe(df[['name', 'region', 'price_original', 'currency', 'price_in_usd']])
 
     else:
         st.warning("No data found. Run 'src/collect_data.py' first!")
@@ -3,11 +3,26 @@ import os
 
 DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'hm_global.db')
 
+def get_connection(**kwargs):
+    """Open a connection with the per-connection PRAGMAs applied.
+
+    journal_mode=WAL is stored in the database file by init_db, but
+    synchronous/temp_store/cache_size only last for the connection.
+    """
+    conn = sqlite3.connect(DB_PATH, **kwargs)
+    conn.execute("PRAGMA synchronous=NORMAL")    # Crash-safe under WAL, one fsync less
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")     # ~20 MB page cache for bulk inserts
+    return conn
+
 def init_db():
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_connection()
     c = conn.cursor()
     
+    # WAL lets the dashboard read while the collector writes (persistent)
+    c.execute("PRAGMA journal_mode=WAL")
+    
     # 1. Products Table (Global ID)
     c.execute('''
         CREATE TABLE IF NOT EXISTS products (
@@ -32,9 +47,31 @@ def init_db():
         )
     ''')
     
+    init_indexes(conn)
+    
     conn.commit()
     conn.close()
     print(f"✅ Database initialized at {DB_PATH}")
 
+def init_indexes(conn=None):
+    """Create the index backing the dashboard's cheapest-first listing.
+
+    `ORDER BY price_in_usd LIMIT 500` walks this index and stops after
+    500 rows instead of scanning and sorting the whole prices table.
+    """
+    own_conn = conn is None
+    if own_conn:
+        conn = get_connection()
+    c = conn.cursor()
+    
+    c.execute('''
+        CREATE INDEX IF NOT EXISTS idx_prices_usd
+        ON prices(price_in_usd)
+    ''')
+    
+    if own_conn:
+        conn.commit()
+        conn.close()
+
 if __name__ == "__main__":
     init_db()
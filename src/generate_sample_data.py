@@ -10,6 +10,9 @@ This creates a complete dataset showing:
 
 import sqlite3
 import random
+import logging
+import os
+import numpy as np
 from datetime import datetime, timedelta
 import sys
 from pathlib import Path
@@ -20,6 +23,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 from database import Database
 from currency_converter import CurrencyConverter
 
+log = logging.getLogger(__name__)
+
 
 class SampleDataGenerator:
     """Generate realistic H&M sample data."""
@@ -85,6 +90,23 @@ class SampleDataGenerator:
         'se': 1.15,  # Sweden 15% more (Nordic premium)
     }
     
+    # Currency used by each region
+    LOCAL_CURRENCY = {
+        'tr': 'TRY', 'us': 'USD', 'uk': 'GBP',
+        'de': 'EUR', 'se': 'SEK'
+    }
+    
+    # Base price range in USD by category
+    PRICE_RANGES = {
+        'Dresses': (29.99, 79.99),
+        'Tops': (9.99, 39.99),
+        'Bottoms': (24.99, 59.99),
+        'Outerwear': (49.99, 149.99)
+    }
+    DEFAULT_PRICE_RANGE = (19.99, 69.99)
+    
+    DISCOUNT_TIERS = [10, 15, 20, 25, 30, 40, 50]
+    
     def __init__(self):
         """Initialize generator."""
         self.db = Database()
@@ -100,28 +122,6 @@ class SampleDataGenerator:
         self.product_counter += 1
         return code
     
-    def generate_base_price(self, category):
-        """Generate base price in USD based on category."""
-        price_ranges = {
-            'Dresses': (29.99, 79.99),
-            'Tops': (9.99, 39.99),
-            'Bottoms': (24.99, 59.99),
-            'Outerwear': (49.99, 149.99)
-        }
-        
-        min_price, max_price = price_ranges.get(category, (19.99, 69.99))
-        return round(random.uniform(min_price, max_price), 2)
-    
-    def generate_discount(self):
-        """Generate realistic discount percentage."""
-        # 60% chance of no discount
-        if random.random() < 0.6:
-            return 0
-        
-        # 40% chance of discount (10-50%)
-        discount_tiers = [10, 15, 20, 25, 30, 40, 50]
-        return random.choice(discount_tiers)
-    
     def generate_dataset(self, products_per_region=40):
         """
         Generate complete dataset.
@@ -134,6 +134,9 @@ class SampleDataGenerator:
         print("GENERATING H&M SAMPLE DATA")
         print("="*70 + "\n")
         
+        # One connection for the whole run; each region is one transaction
+        self.db.connect()
+        
         all_products = []
         
         # Create global products (40% - available in multiple regions)
@@ -159,16 +162,21 @@ class SampleDataGenerator:
         
         print(f"✓ Created {len(all_products)} global products\n")
         
+        # Index global products by region in one pass
+        region_products_map = {region_code: [] for region_code in self.REGION_MULTIPLIERS}
+        for product in all_products:
+            for region_code in product['regions']:
+                region_products_map[region_code].append(product)
+        
         # Now populate each region
         total_saved = 0
         
         for region_code, multiplier in self.REGION_MULTIPLIERS.items():
-            region_name = Database().get_region_id.__self__.REGIONS  # Get region name
-            
-            print(f"Populating {region_code.upper()}...")
+            log.info("Populating %s...", region_code.upper())
             
             # Add global products for this region
-            region_products = [p for p in all_products if region_code in p['regions']]
+            region_products = region_products_map[region_code]
+            global_in_region = len(region_products)
             
             # Add region-specific products (60%)
             local_count = products_per_region - len(region_products)
@@ -185,70 +193,78 @@ class SampleDataGenerator:
                     'is_global': False
                 })
             
-            # Save all products for this region
+            # Build all rows for this region, then insert them in one batch
+            local_currency = self.LOCAL_CURRENCY[region_code]
+            n = len(region_products)
+            
+            # Generate prices for the whole region as arrays
+            min_price, max_price = np.array(
+                [self.PRICE_RANGES.get(p['category'], self.DEFAULT_PRICE_RANGE) for p in region_products]
+            ).reshape(n, 2).T
+            base_price_usd = np.round(np.random.uniform(min_price, max_price), 2)
+            regional_price_usd = base_price_usd * multiplier
+            
+            # Convert to local currency (rates are USD per unit of local currency)
+            price_local = regional_price_usd / self.converter.rates[local_currency]
+            
+            # Add discount (60% no discount, 40% one of the tiers)
+            discount_pct = np.where(
+                np.random.random(n) < 0.6, 0, np.random.choice(self.DISCOUNT_TIERS, n)
+            )
+            discount_factor = 1 - discount_pct / 100
+            original_price = np.where(discount_pct > 0, np.round(price_local, 2), np.nan)
+            
+            price_rows = list(zip(
+                np.round(price_local * discount_factor, 2).tolist(),
+                [local_currency] * n,
+                np.round(regional_price_usd * discount_factor, 2).tolist(),
+                [None if np.isnan(x) else x for x in original_price.tolist()],
+                discount_pct.tolist(),
+                (np.random.random(n) > 0.05).tolist()  # 95% in stock
+            ))
+            
+            # Save all products for this region on the open connection and
+            # commit once, instead of a connect/commit/close per product
             saved_count = 0
-            for product in region_products:
-                try:
-                    self.db.connect()
-                    
-                    # Insert product
+            try:
+                region_id = self.db.get_region_id(region_code)
+                
+                for product, (price, currency, price_usd, original, discount, in_stock) in zip(
+                        region_products, price_rows):
                     product_id = self.db.insert_product(
                         product_code=product['code'],
                         product_name=product['name'],
                         category=product['category']
                     )
-                    
-                    # Generate price
-                    base_price_usd = self.generate_base_price(product['category'])
-                    regional_price_usd = base_price_usd * multiplier
-                    
-                    # Convert to local currency
-                    local_currency = {
-                        'tr': 'TRY', 'us': 'USD', 'uk': 'GBP', 
-                        'de': 'EUR', 'se': 'SEK'
-                    }[region_code]
-                    
-                    price_local = self.converter.convert(
-                        regional_price_usd, 'USD', local_currency
-                    )
-                    
-                    # Add discount
-                    discount_pct = self.generate_discount()
-                    if discount_pct > 0:
-                        original_price = price_local
-                        price_local = price_local * (1 - discount_pct / 100)
-                    else:
-                        original_price = None
-                    
-                    # Get region ID
-                    region_id = self.db.get_region_id(region_code)
-                    
-                    # Insert price
                     self.db.insert_price(
                         product_id=product_id,
                         region_id=region_id,
-                        price_local=round(price_local, 2),
-                        currency=local_currency,
-                        price_usd=round(regional_price_usd * (1 - discount_pct / 100), 2),
-                        original_price_local=round(original_price, 2) if original_price else None,
-                        discount_percentage=discount_pct,
-                        in_stock=random.random() > 0.05  # 95% in stock
+                        price_local=price,
+                        currency=currency,
+                        price_usd=price_usd,
+                        original_price_local=original,
+                        discount_percentage=discount,
+                        in_stock=in_stock
                     )
-                    
-                    self.db.close()
-                    saved_count += 1
-                    total_saved += 1
-                    
-                except Exception as e:
-                    print(f"Error saving product: {e}")
-                    continue
+                
+                self.db.conn.commit()
+                saved_count = len(price_rows)
+                total_saved += saved_count
+                
+            except Exception as e:
+                self.db.conn.rollback()
+                log.warning("Failed to save %s products: %s", region_code, e)
+                log.debug("insert failed", exc_info=True)
             
-            print(f"  → Saved {saved_count} products ({len([p for p in region_products if p['is_global']])} global, {saved_count - len([p for p in region_products if p['is_global']])} local)")
+            log.info("  → Saved %d products (%d global, %d local)",
+                     saved_count, global_in_region, saved_count - global_in_region)
         
         # Add some historical data (7 days ago) for trend analysis
-        print(f"\nAdding historical data for price trends...")
+        log.info("Adding historical data for price trends...")
         self._add_historical_data(days_ago=7)
         
+        self.db.close()
+        
         print("\n" + "="*70)
         print("SUMMARY")
         print("="*70)
@@ -259,49 +275,53 @@ class SampleDataGenerator:
         print("="*70 + "\n")
         
     def _add_historical_data(self, days_ago=7):
-        """Add historical prices for trend analysis."""
-        self.db.connect()
+        """Add historical prices for trend analysis (expects an open connection)."""
+        # Sample 50 current products and their latest price in a single query
+        self.db.cursor.execute("""
+            WITH latest AS (
+                SELECT product_id, region_id, price_local, currency, price_usd, scraped_at,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY product_id, region_id ORDER BY scraped_at DESC
+                       ) AS rn
+                FROM prices
+            )
+            SELECT product_id, region_id, price_local, currency, price_usd
+            FROM latest
+            WHERE rn = 1 AND scraped_at > datetime('now', '-1 day')
+            ORDER BY RANDOM()
+            LIMIT 50
+        """)
+        latest = self.db.cursor.fetchall()
         
-        # Get all current products
-        self.db.cursor.execute("SELECT product_id, region_id FROM prices WHERE scraped_at > datetime('now', '-1 day')")
-        current_prices = self.db.cursor.fetchall()
-        
-        # Add historical data
-        for product_id, region_id in random.sample(current_prices, min(50, len(current_prices))):
-            # Get current price
-            self.db.cursor.execute("""
-                SELECT price_local, currency, price_usd 
-                FROM prices 
-                WHERE product_id = ? AND region_id = ?
-                ORDER BY scraped_at DESC LIMIT 1
-            """, (product_id, region_id))
-            
-            result = self.db.cursor.fetchone()
-            if not result:
-                continue
-                
-            current_price, currency, price_usd = result
-            
+        # Build historical rows, then insert them with one prepared statement
+        past_date = datetime.now() - timedelta(days=days_ago)
+        history_rows = []
+        for product_id, region_id, current_price, currency, price_usd in latest:
             # Historical price (5-10% different)
             variation = random.uniform(0.95, 1.05)
             historical_price = current_price * variation
             historical_usd = price_usd * variation
             
-            # Insert historical record
-            past_date = datetime.now() - timedelta(days=days_ago)
-            self.db.cursor.execute("""
-                INSERT INTO prices 
-                (product_id, region_id, price_local, currency, price_usd, scraped_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (product_id, region_id, round(historical_price, 2), currency, 
-                  round(historical_usd, 2), past_date))
+            history_rows.append((product_id, region_id, round(historical_price, 2), currency, 
+                                 round(historical_usd, 2), past_date))
         
+        self.db.cursor.executemany("""
+            INSERT INTO prices 
+            (product_id, region_id, price_local, currency, price_usd, scraped_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, history_rows)
         self.db.conn.commit()
-        self.db.close()
-        print(f"  → Added historical prices for 50 products")
+        log.info("  → Added historical prices for %d products", len(history_rows))
 
 
 if __name__ == "__main__":
+    # Set LOGLEVEL=WARNING for a quiet run
+    logging.basicConfig(
+        level=os.environ.get('LOGLEVEL', 'INFO').upper(),
+        format='%(asctime)s %(message)s',
+        handlers=[logging.StreamHandler()]
+    )
+    
     print("\n🎨 H&M Sample Data Generator")
     print("This creates realistic demo data for your portfolio\n")
     
@@ -5,87 +5,368 @@ Uses headless browser to bypass anti-bot protection (403 errors).
 Playwright launches a real Chrome browser that executes JavaScript,
 making the scraper indistinguishable from a human visitor.
 
+Scrapes are async so several regions can load concurrently
+(see HMScraper.scrape_all_regions). The listing's JSON feed is tried first,
+then server-rendered HTML via httpx + selectolax, so Chromium only starts
+when needed.
+
 IMPORTANT: Run 'playwright install chromium' after pip install
 """
 
-from playwright.sync_api import sync_playwright
-import time
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from selectolax.parser import HTMLParser
+import httpx
+import orjson
+from price_parser import parse_price
+import numpy as np
+import asyncio
+import contextlib
+import math
 import random
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import atexit
+import os
+import queue
 from datetime import datetime
+from types import MappingProxyType
+
+
+# Every product tile layout H&M has used, as one selector list so the DOM
+# is traversed once instead of once per layout
+PRODUCT_SELECTOR = 'li.product-item, article.hm-product-item, [data-articlecode]'
+
+# Runs inside the page: collects code/name/price text for every product tile
+# so extraction costs one browser round-trip instead of several per product.
+# Tiles repeating an already-seen article code (colour swatches, carousels,
+# an <li> and its nested <article>) are skipped before any text is read.
+_EXTRACT_JS = """
+({selector, maxProducts}) => {
+    const tiles = document.querySelectorAll(selector);
+    const seen = new Set();
+    const products = [];
+    for (const el of tiles) {
+        if (products.length >= maxProducts) break;
+        // The article tag holds the code; it may be the tile itself or nested
+        const article = el.querySelector('article') || el;
+        const code = article.getAttribute('data-articlecode') || el.getAttribute('data-articlecode');
+        if (!code || seen.has(code)) continue;
+        seen.add(code);
+        const text = (selector) => {
+            const node = el.querySelector(selector);
+            return node ? node.innerText.trim() : null;
+        };
+        products.push({
+            code: code,
+            name: text('.item-heading, h3.link, a.link'),
+            price: text('.price, .ae-currency-price, [class*="price"]'),
+            old: text('.price-old, .old-price, [class*="original"]'),
+        });
+    }
+    return products;
+}
+"""
+
+# Relaunch a pooled browser after this many contexts to cap its memory growth
+BROWSER_POOL_RECYCLE_AFTER = 100
+
+# Cookies/consent state survive between runs here. Chromium's HTTP cache
+# is not persisted: request routing (see HMScraper._route_request) makes
+# Playwright disable the browser cache, so a --disk-cache-dir would be unused.
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'cache')
+
+
+class BrowserPool:
+    """
+    Pool of long-lived headless Chromium browsers.
+    
+    Launching Chromium costs 1-2 s, so browsers are started once and each
+    scrape gets a fresh (cheap, isolated) BrowserContext on one of them.
+    Browsers are launched on first demand (up to `pool_size`), so a pool
+    that is never used costs nothing. A browser is handed to one caller
+    at a time and relaunched after `recycle_after` contexts.
+    
+    Usage:
+        async with BrowserPool(pool_size=4) as pool:
+            context = await pool.acquire(locale='en-US')
+            ...
+            await pool.release(context)
+    """
+    
+    LAUNCH_ARGS = ['--disable-blink-features=AutomationControlled']
+    
+    def __init__(self, pool_size=4, recycle_after=BROWSER_POOL_RECYCLE_AFTER):
+        self.pool_size = pool_size
+        self.recycle_after = recycle_after
+        self._playwright = None
+        self._browsers = None
+        self._launched = 0
+        self._start_lock = None
+        self._usage = {}
+    
+    async def __aenter__(self):
+        await self.start()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    async def start(self):
+        """Prepare the pool; Playwright and browsers start on first acquire."""
+        self._browsers = asyncio.Queue()
+        self._start_lock = asyncio.Lock()
+    
+    async def _launch(self):
+        async with self._start_lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+        browser = await self._playwright.chromium.launch(headless=True, args=self.LAUNCH_ARGS)
+        self._usage[browser] = 0
+        return browser
+    
+    async def acquire(self, **context_options):
+        """Wait for a free browser and open a new context on it."""
+        if self._browsers.empty() and self._launched < self.pool_size:
+            browser = None
+        else:
+            browser = await self._browsers.get()
+        
+        # None stands for a free slot: either never launched or its browser
+        # failed to relaunch (see release), so launch one for it now
+        if browser is None:
+            self._launched += 1
+            try:
+                browser = await self._launch()
+            except Exception:
+                # Hand the slot on so a waiting caller retries the launch
+                self._launched -= 1
+                await self._browsers.put(None)
+                raise
+        try:
+            context = await browser.new_context(**context_options)
+        except Exception:
+            await self._browsers.put(browser)
+            raise
+        self._usage[browser] += 1
+        return context
+    
+    async def release(self, context):
+        """Close a context and return its browser to the pool."""
+        browser = context.browser
+        try:
+            await context.close()
+            if self._usage[browser] >= self.recycle_after:
+                del self._usage[browser]
+                await browser.close()
+                try:
+                    browser = await self._launch()
+                except Exception:
+                    # Queue a free slot instead of the closed browser, so the
+                    # next (or an already waiting) acquire launches a new one
+                    browser = None
+                    self._launched -= 1
+                    raise
+        finally:
+            await self._browsers.put(browser)
+    
+    async def close(self):
+        """Close every browser and stop Playwright."""
+        while not self._browsers.empty():
+            browser = self._browsers.get_nowait()
+            if browser is not None:
+                await browser.close()
+        self._usage.clear()
+        self._launched = 0
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+# Column dtypes used by products_to_columns
+PRODUCT_COLUMNS = {
+    'product_code': 'U16',
+    'price_local': np.float64,
+    'original_price_local': np.float64,
+    'discount_percentage': np.float32,
+    'in_stock': np.bool_,
+}
+
+
+def products_to_columns(products):
+    """
+    Convert scraped product dicts into one NumPy array per field.
+    
+    Cross-region statistics (min/mean price, discount depth) can then run
+    as vectorised operations instead of loops over dicts. A missing
+    original price becomes NaN, and the discount is recomputed for the
+    whole batch at once.
+    
+    Args:
+        products: List of product dictionaries from scrape_category
+        
+    Returns:
+        Dict of field name -> np.ndarray (keys as in PRODUCT_COLUMNS)
+    """
+    n = len(products)
+    columns = {name: np.empty(n, dtype=dtype) for name, dtype in PRODUCT_COLUMNS.items()}
+    
+    for i, product in enumerate(products):
+        original = product['original_price_local']
+        columns['product_code'][i] = product['product_code']
+        columns['price_local'][i] = product['price_local']
+        columns['original_price_local'][i] = np.nan if original is None else original
+        columns['in_stock'][i] = product['in_stock']
+    
+    price = columns['price_local']
+    original = columns['original_price_local']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        discount = np.where(original > price, (original - price) / original * 100, 0)
+    columns['discount_percentage'][:] = np.round(discount, 2)
+    
+    return columns
+
+
+def price_summary(products):
+    """
+    Summarise a region's scraped prices using the columnar view.
+    
+    Args:
+        products: List of product dictionaries from one region
+        
+    Returns:
+        Dict with count, min/mean/max local price, number of discounted
+        products and their mean discount (0 if none)
+    """
+    columns = products_to_columns(products)
+    price = columns['price_local']
+    discount = columns['discount_percentage']
+    discounted = discount > 0
+    
+    if not len(price):
+        return {'count': 0, 'min_price': np.nan, 'mean_price': np.nan, 'max_price': np.nan,
+                'discounted': 0, 'mean_discount': 0.0}
+    
+    return {
+        'count': len(price),
+        'min_price': float(price.min()),
+        'mean_price': float(price.mean()),
+        'max_price': float(price.max()),
+        'discounted': int(discounted.sum()),
+        'mean_discount': float(discount[discounted].mean()) if discounted.any() else 0.0,
+    }
 
 
 class HMScraper:
     """Scraper for H&M websites using Playwright headless browser."""
     
-    # H&M regional sites
-    REGIONS = {
-        'tr': {
+    __slots__ = (
+        'region_code', 'region', 'base_url', 'currency', 'locale_bcp47',
+        '_decimal_sep', '_thousands_sep', 'logger', 'stats', 'backend',
+    )
+    
+    # H&M regional sites (read-only: shared by every scraper instance)
+    REGIONS = MappingProxyType({
+        'tr': MappingProxyType({
             'name': 'Turkey',
             'base_url': 'https://www2.hm.com/tr_tr',
             'currency': 'TRY',
             'language': 'tr_tr'
-        },
-        'us': {
+        }),
+        'us': MappingProxyType({
             'name': 'United States',
             'base_url': 'https://www2.hm.com/en_us',
             'currency': 'USD',
             'language': 'en_us'
-        },
-        'uk': {
+        }),
+        'uk': MappingProxyType({
             'name': 'United Kingdom',
             'base_url': 'https://www2.hm.com/en_gb',
             'currency': 'GBP',
             'language': 'en_gb'
-        },
-        'de': {
+        }),
+        'de': MappingProxyType({
             'name': 'Germany',
             'base_url': 'https://www2.hm.com/de_de',
             'currency': 'EUR',
             'language': 'de_de'
-        },
-        'se': {
+        }),
+        'se': MappingProxyType({
             'name': 'Sweden',
             'base_url': 'https://www2.hm.com/sv_se',
             'currency': 'SEK',
             'language': 'sv_se'
-        }
-    }
+        })
+    })
     
     # Category paths (adjust based on actual H&M URLs)
-    CATEGORIES = {
-        'tr': ['/kadin/urunler/elbiseler.html'],
-        'us': ['/women/products/dresses.html'],
-        'uk': ['/ladies/products/dresses.html'],
-        'de': ['/damen/produkte/kleider.html'],
-        'se': ['/dam/produkter/klanningar.html'],
-    }
+    CATEGORIES = MappingProxyType({
+        'tr': ('/kadin/urunler/elbiseler.html',),
+        'us': ('/women/products/dresses.html',),
+        'uk': ('/ladies/products/dresses.html',),
+        'de': ('/damen/produkte/kleider.html',),
+        'se': ('/dam/produkter/klanningar.html',),
+    })
     
-    def __init__(self, region_code='tr'):
+    # Decimal and thousands separators used in each region's prices
+    _SEPARATORS = MappingProxyType({
+        'tr': (',', '.'),
+        'us': ('.', ','),
+        'uk': ('.', ','),
+        'de': (',', '.'),
+        'se': (',', '.'),
+    })
+    
+    # Browser-like headers for both the HTTP fast path and Playwright contexts
+    HEADERS = MappingProxyType({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept-Language': 'en-US,en;q=0.9',
+    })
+    
+    # JSON feed the listing pages hydrate from, relative to the category
+    # path without ".html" (found in the browser's network tab)
+    PRODUCT_LISTING_JSON = '/_jcr_content/main/productlisting.display.json'
+    
+    # 'auto': JSON/static fast paths, Playwright only if they fail;
+    # 'http': never start a browser; 'playwright': always render
+    BACKENDS = ('auto', 'http', 'playwright')
+    
+    # Requests the scraper never needs: page weight and trackers only
+    BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+    BLOCKED_URL_PARTS = ('google-analytics', 'doubleclick', 'facebook.net', 'hotjar')
+    
+    def __init__(self, region_code='tr', backend='auto'):
         """
         Initialize scraper for specific region.
         
         Args:
             region_code: Region code (tr, us, uk, de, se)
+            backend: Scraping strategy, one of BACKENDS
         """
         if region_code not in self.REGIONS:
             raise ValueError(f"Invalid region code: {region_code}")
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Invalid backend: {backend}")
             
         self.region_code = region_code
+        self.backend = backend
         self.region = self.REGIONS[region_code]
         self.base_url = self.region['base_url']
         self.currency = self.region['currency']
+        self.locale_bcp47 = self.region['language'].replace('_', '-')
+        self._decimal_sep, self._thousands_sep = self._SEPARATORS[region_code]
         
         # Logging
         self.logger = logging.getLogger(f"hm_scraper.{region_code}")
-        self.logger.setLevel(logging.INFO)
         
         # Statistics
         self.stats = {
             'requests': 0,
             'successes': 0,
             'failures': 0,
-            'products_found': 0
+            'products_found': 0,
+            # JSON/static attempts that fell through to the next strategy;
+            # requests/successes/failures count each category once
+            'fast_path_misses': 0
         }
         
     def _extract_price(self, price_text):
@@ -97,170 +378,436 @@ class HMScraper:
         - US: "$29.99"
         - UK: "£29.99"  
         - Germany: "29,99 €"
+        
+        The decimal separator is known per region, so the other one
+        ("1.299,99", "1,299.99") is a thousands separator; labels that
+        don't fit the region's convention are rejected (see parse_price).
         """
         if not price_text:
             return None
-            
+        
+        price = parse_price(price_text, self._decimal_sep, self._thousands_sep)
+        if math.isnan(price):
+            self.logger.warning("Failed to parse price '%s'", price_text)
+            return None
+        
+        return price
+    
+    def _build_product(self, product_code, product_name, price_text, original_text, url):
+        """
+        Turn raw tile fields into a product dictionary.
+        
+        Returns:
+            Product dictionary, or None if the tile has no code or price
+        """
+        if not product_code:
+            return None  # Skip if no code - can't track across regions
+        
+        price = self._extract_price(price_text)
+        if not price:
+            return None  # Skip if no valid price
+        
+        # Original price (if discounted)
+        original_price = self._extract_price(original_text) if original_text else None
+        
+        # Calculate discount
+        discount = 0
+        if original_price and price and original_price > price:
+            discount = ((original_price - price) / original_price) * 100
+        
+        # Check stock (basic check - if on listing page, likely in stock)
+        in_stock = True
+        
+        return {
+            'product_code': product_code,
+            'product_name': product_name or "Unknown Product",
+            'product_url': url,  # Category URL
+            'price_local': price,
+            'original_price_local': original_price,
+            'discount_percentage': round(discount, 2),
+            'currency': self.currency,
+            'region_code': self.region_code,
+            'in_stock': in_stock
+        }
+    
+    def _http_client(self):
+        """HTTP/2 client for the no-browser fast paths; share it across a region's categories."""
+        return httpx.AsyncClient(http2=True, headers=self.HEADERS, timeout=10,
+                                 follow_redirects=True)
+    
+    async def _try_json_api(self, client, category_path, max_products):
+        """
+        Fetch the category's product-listing JSON directly.
+        
+        This is the data the listing page renders from, so neither HTML
+        parsing nor a browser is needed.
+        
+        Returns:
+            List of product dictionaries, or None if the feed is unavailable
+            or its format has changed
+        """
+        url = self.base_url + category_path
+        json_url = self.base_url + category_path.rsplit('.html', 1)[0] + self.PRODUCT_LISTING_JSON
+        params = {'offset': 0, 'page-size': max_products}
+        
         try:
-            # Remove currency symbols and text
-            cleaned = price_text.strip()
-            cleaned = cleaned.replace('TL', '').replace('₺', '')
-            cleaned = cleaned.replace('$', '').replace('£', '').replace('€', '')
-            cleaned = cleaned.replace('SEK', '').replace('kr', '')
-            cleaned = cleaned.strip()
-            
-            # Handle different decimal separators
-            # European format: 1.299,99 -> 1299.99
-            if ',' in cleaned and '.' in cleaned:
-                cleaned = cleaned.replace('.', '').replace(',', '.')
-            # European comma: 299,99 -> 299.99
-            elif ',' in cleaned:
-                cleaned = cleaned.replace(',', '.')
-            # US format with comma thousands: 1,299.99 -> 1299.99
-            else:
-                cleaned = cleaned.replace(',', '')
+            response = await client.get(json_url, params=params)
+            response.raise_for_status()
+            items = orjson.loads(response.content)['products']
+        except (httpx.HTTPError, orjson.JSONDecodeError, KeyError, TypeError) as e:
+            self.stats['fast_path_misses'] += 1
+            self.logger.info("Product JSON unavailable (%s), falling back to HTML", e)
+            return None
+        
+        products = []
+        seen = set()
+        try:
+            for item in items:
+                if len(products) >= max_products:
+                    break
+                
+                product_code = item.get('articleCode')
+                if not product_code or product_code in seen:
+                    continue
+                seen.add(product_code)
+                
+                # 'price' is the regular price; 'redPrice' is set when discounted
+                red_price = item.get('redPrice')
+                product = self._build_product(
+                    product_code,
+                    item.get('title'),
+                    red_price or item.get('price'),
+                    item.get('price') if red_price else None,
+                    url
+                )
+                if product:
+                    products.append(product)
+        except (AttributeError, TypeError) as e:
+            self.stats['fast_path_misses'] += 1
+            self.logger.warning("Unexpected product JSON format: %s", e)
+            return None
+        
+        if not products:
+            self.stats['fast_path_misses'] += 1
+            return None
+        
+        self.stats['requests'] += 1
+        self.stats['successes'] += 1
+        self.stats['products_found'] += len(products)
+        self.logger.info("✓ Scraped %d products from the listing JSON", len(products))
+        return products
+    
+    async def _try_without_browser(self, client, category_path, max_products):
+        """
+        Try the listing JSON, then the static HTML.
+        
+        Returns:
+            List of product dictionaries, or None if the page must be rendered
+            (always None for the 'playwright' backend, [] for 'http')
+        """
+        if self.backend == 'playwright':
+            return None
+        
+        products = await self._try_json_api(client, category_path, max_products)
+        if products is None:
+            products = await self._try_static(client, self.base_url + category_path, max_products)
+        if products is None and self.backend == 'http':
+            self.stats['requests'] += 1
+            self.stats['failures'] += 1
+            self.logger.warning("No products without a browser and backend is 'http'")
+            return []
+        return products
+    
+    async def _try_static(self, client, url, max_products):
+        """
+        Fetch the listing page over plain HTTP and parse it without a browser.
+        
+        Some regions serve the product grid server-side; for those this
+        skips Chromium entirely.
+        
+        Returns:
+            List of product dictionaries, or None if the page needs JavaScript
+        """
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            self.stats['fast_path_misses'] += 1
+            self.logger.info("Static fetch failed (%s), falling back to browser", e)
+            return None
+        
+        tree = HTMLParser(response.text)
+        nodes = tree.css(PRODUCT_SELECTOR)
+        if len(nodes) < 3:
+            # Grid is rendered client-side
+            self.stats['fast_path_misses'] += 1
+            return None
+        
+        def text(node, selector):
+            found = node.css_first(selector)
+            return found.text(strip=True) if found else None
+        
+        products = []
+        seen = set()
+        for node in nodes:
+            if len(products) >= max_products:
+                break
             
-            return float(cleaned)
+            # Skip repeated tiles of the same article before reading any text
+            article = node.css_first('article') or node
+            product_code = article.attributes.get('data-articlecode') or node.attributes.get('data-articlecode')
+            if not product_code or product_code in seen:
+                continue
+            seen.add(product_code)
             
-        except (ValueError, AttributeError) as e:
-            self.logger.warning(f"Failed to parse price '{price_text}': {e}")
+            product = self._build_product(
+                product_code,
+                text(node, '.item-heading, h3.link, a.link'),
+                text(node, '.price, .ae-currency-price, [class*="price"]'),
+                text(node, '.price-old, .old-price, [class*="original"]'),
+                url
+            )
+            if product:
+                products.append(product)
+        
+        if not products:
+            # Tile shells only; codes/prices are filled in by JavaScript
+            self.stats['fast_path_misses'] += 1
             return None
+        
+        self.stats['requests'] += 1
+        self.stats['successes'] += 1
+        self.stats['products_found'] += len(products)
+        self.logger.info("✓ Scraped %d products without a browser", len(products))
+        return products
     
-    def scrape_category(self, category_path, max_products=30):
+    async def iter_category(self, category_path, max_products=30, pool=None, context=None):
         """
-        Scrape products from a category page using Playwright.
+        Scrape products from a category page, yielding them as they are ready.
+        
+        Tries the listing JSON and a plain HTTP fetch first and only uses
+        Playwright when the page has to be rendered.
         
         Args:
             category_path: Category URL path
             max_products: Maximum products to scrape
+            pool: BrowserPool to borrow a browser from (a one-off
+                browser is launched if omitted)
+            context: Already-open BrowserContext to reuse (skips the pool)
             
+        Yields:
+            Product dictionaries
+        """
+        if context is None:
+            async for product in self.iter_region([category_path], max_products, pool):
+                yield product
+            return
+        
+        url = self.base_url + category_path
+        print(f"🌍 Scraping {self.region['name']} from {url}...")
+        
+        async with self._http_client() as client:
+            products = await self._try_without_browser(client, category_path, max_products)
+        if products is None:
+            products = await self._scrape_with_browser(url, max_products, context)
+        for product in products:
+            yield product
+    
+    async def scrape_category(self, category_path, max_products=30, pool=None, context=None):
+        """
+        Scrape products from a category page (see iter_category).
+        
         Returns:
             List of product dictionaries
         """
-        url = self.base_url + category_path
+        return [product async for product in
+                self.iter_category(category_path, max_products, pool, context)]
+    
+    async def iter_region(self, categories=None, max_products=30, pool=None):
+        """
+        Scrape several categories of this region through one browser context.
         
-        self.logger.info(f"🌍 Launching browser for {self.region['name']}...")
-        print(f"🌍 Scraping {self.region['name']} from {url}...")
+        Categories in a region share cookies, cache and the HTTP/2
+        connection, so the context is opened once (only if some page
+        actually needs rendering) and each category gets its own page.
+        Products are yielded per category, so callers can store one
+        category while the next is loading.
         
-        products = []
+        Args:
+            categories: Category URL paths (defaults to CATEGORIES for the region)
+            max_products: Maximum products per category
+            pool: BrowserPool to borrow a browser from (a one-off
+                browser is launched if needed and omitted)
+            
+        Yields:
+            Product dictionaries
+        """
+        if categories is None:
+            categories = self.CATEGORIES[self.region_code]
         
-        with sync_playwright() as p:
-            # Launch headless Chrome
-            browser = p.chromium.launch(
-                headless=True,
-                args=['--disable-blink-features=AutomationControlled']
-            )
+        found = 0
+        async with contextlib.AsyncExitStack() as stack:
+            # One HTTP/2 connection for every category's fast-path requests
+            client = await stack.enter_async_context(self._http_client())
+            context = None
+            for category_path in categories:
+                url = self.base_url + category_path
+                print(f"🌍 Scraping {self.region['name']} from {url}...")
+                
+                products = await self._try_without_browser(client, category_path, max_products)
+                if products is None:
+                    if context is None:
+                        if pool is None:
+                            pool = await stack.enter_async_context(BrowserPool(pool_size=1))
+                        context = await self._open_context(pool)
+                        stack.push_async_callback(pool.release, context)
+                    
+                    products = await self._scrape_with_browser(url, max_products, context)
+                
+                found += len(products)
+                for product in products:
+                    yield product
             
-            # Create context with realistic user agent
-            context = browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                viewport={'width': 1920, 'height': 1080},
-                locale=self.region['language'].replace('_', '-')
-            )
+            # Keep the cookies/consent state so the next run starts warm
+            if context is not None and found:
+                await self._save_storage_state(context)
+    
+    async def scrape_region(self, categories=None, max_products=30, pool=None):
+        """
+        Scrape several categories of this region (see iter_region).
+        
+        Returns:
+            List of product dictionaries
+        """
+        return [product async for product in self.iter_region(categories, max_products, pool)]
+    
+    async def _open_context(self, pool):
+        """Borrow a browser from the pool and open a region-configured context."""
+        self.logger.info("🌍 Opening browser context for %s...", self.region['name'])
+        
+        # Fresh isolated context on a warm, pooled browser, seeded with
+        # the previous run's cookies so consent/anti-bot checks are skipped
+        state_path = self._storage_state_path()
+        context = await pool.acquire(
+            user_agent=self.HEADERS['User-Agent'],
+            viewport={'width': 1920, 'height': 1080},
+            locale=self.locale_bcp47,
+            storage_state=state_path if os.path.exists(state_path) else None
+        )
+        try:
+            await context.route('**/*', self._route_request)
+        except Exception:
+            await pool.release(context)
+            raise
+        return context
+    
+    def _storage_state_path(self):
+        return os.path.join(CACHE_DIR, f'hm_{self.region_code}_state.json')
+    
+    async def _save_storage_state(self, context):
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            await context.storage_state(path=self._storage_state_path())
+        except Exception as e:
+            self.logger.warning("Could not save browser state: %s", e)
+    
+    @classmethod
+    async def _route_request(cls, route):
+        """Abort images/fonts/media/styles and tracker calls; let the rest through."""
+        request = route.request
+        if (request.resource_type in cls.BLOCKED_RESOURCE_TYPES
+                or any(part in request.url for part in cls.BLOCKED_URL_PARTS)):
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def _scrape_with_browser(self, url, max_products, context):
+        """Render the listing page in a new tab of `context` and extract products."""
+        products = []
+        page = None
+        
+        try:
+            page = await context.new_page()
             
-            page = context.new_page()
+            # Navigate to page
+            self.stats['requests'] += 1
+            # Don't wait for analytics traffic to go idle; the grid selector below is the real signal
+            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
             
+            # Wait for product grid to load
             try:
-                # Navigate to page
-                self.stats['requests'] += 1
-                page.goto(url, wait_until='networkidle', timeout=60000)
-                
-                # Wait for product grid to load
-                try:
-                    page.wait_for_selector('li.product-item, article.hm-product-item', timeout=15000)
-                except:
-                    self.logger.warning("Timeout waiting for products. Page structure may have changed.")
-                    self.stats['failures'] += 1
-                    return products
-                
-                # Scroll to trigger lazy loading
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                time.sleep(2)
-                
-                # Find product items (try multiple selectors)
-                product_elements = page.query_selector_all('li.product-item')
-                
-                if not product_elements:
-                    product_elements = page.query_selector_all('article.hm-product-item')
-                
-                if not product_elements:
-                    # Try even more generic selector
-                    product_elements = page.query_selector_all('[data-articlecode]')
-                
-                print(f"   → Found {len(product_elements)} products on page")
-                
-                # Extract data from each product
-                for i, item in enumerate(product_elements[:max_products]):
-                    try:
-                        # Get article tag (might be the item itself or nested)
-                        article = item.query_selector('article')
-                        if not article:
-                            article = item
-                        
-                        # Extract product code (H&M's global identifier)
-                        product_code = article.get_attribute('data-articlecode')
-                        if not product_code:
-                            product_code = item.get_attribute('data-articlecode')
-                        
-                        if not product_code:
-                            continue  # Skip if no code - can't track across regions
-                        
-                        # Extract product name
-                        name_elem = item.query_selector('.item-heading, h3.link, a.link')
-                        product_name = name_elem.inner_text().strip() if name_elem else "Unknown Product"
-                        
-                        # Extract price
-                        price_elem = item.query_selector('.price, .ae-currency-price, [class*="price"]')
-                        price_text = price_elem.inner_text().strip() if price_elem else None
-                        price = self._extract_price(price_text)
-                        
-                        if not price:
-                            continue  # Skip if no valid price
-                        
-                        # Extract original price (if discounted)
-                        original_elem = item.query_selector('.price-old, .old-price, [class*="original"]')
-                        original_price = None
-                        if original_elem:
-                            original_price = self._extract_price(original_elem.inner_text())
-                        
-                        # Calculate discount
-                        discount = 0
-                        if original_price and price and original_price > price:
-                            discount = ((original_price - price) / original_price) * 100
-                        
-                        # Check stock (basic check - if on listing page, likely in stock)
-                        in_stock = True
-                        
-                        products.append({
-                            'product_code': product_code,
-                            'product_name': product_name,
-                            'product_url': url,  # Category URL
-                            'price_local': price,
-                            'original_price_local': original_price,
-                            'discount_percentage': round(discount, 2),
-                            'currency': self.currency,
-                            'region_code': self.region_code,
-                            'in_stock': in_stock
-                        })
-                        
-                        self.stats['products_found'] += 1
-                        
-                    except Exception as e:
-                        self.logger.debug(f"Error parsing product {i}: {e}")
-                        continue
-                
-                self.stats['successes'] += 1
-                self.logger.info(f"✓ Successfully scraped {len(products)} products")
-                
-            except Exception as e:
+                await page.wait_for_selector(PRODUCT_SELECTOR, timeout=15000)
+            except PlaywrightTimeoutError:
+                self.logger.warning("Timeout waiting for products. Page structure may have changed.")
                 self.stats['failures'] += 1
-                self.logger.error(f"Error during scraping: {e}")
-                
-            finally:
-                browser.close()
+                return products
+            
+            # Scroll to trigger lazy loading, then wait until enough tiles exist
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            try:
+                await page.wait_for_function(
+                    "document.querySelectorAll('[data-articlecode]').length >= %d" % min(max_products, 10),
+                    timeout=10000
+                )
+            except PlaywrightTimeoutError:
+                pass  # Proceed with whatever has loaded
+            
+            # Extract every product in one in-page call instead of a
+            # browser round-trip per selector/attribute/text lookup
+            raw_products = await page.evaluate(
+                _EXTRACT_JS, {'selector': PRODUCT_SELECTOR, 'maxProducts': max_products}
+            )
+            
+            print(f"   → Found {len(raw_products)} products on page")
+            
+            for raw in raw_products:
+                product = self._build_product(raw['code'], raw['name'], raw['price'], raw['old'], url)
+                if product:
+                    products.append(product)
+                    self.stats['products_found'] += 1
+            
+            self.stats['successes'] += 1
+            self.logger.info("✓ Successfully scraped %d products", len(products))
+            
+        except Exception as e:
+            self.stats['failures'] += 1
+            self.logger.error("Error during scraping: %s", e)
+            
+        finally:
+            if page is not None:
+                await page.close()
         
         return products
     
+    @classmethod
+    async def scrape_all_regions(cls, categories=None, max_products=30, max_concurrency=5,
+                                 backend='auto'):
+        """
+        Scrape several regions concurrently.
+        
+        Args:
+            categories: Dict of region code -> category paths (defaults to CATEGORIES)
+            max_products: Maximum products per category
+            max_concurrency: Maximum browsers running at once
+            backend: Scraping strategy for every region, one of BACKENDS
+            
+        Returns:
+            Dict of region code -> list of product dictionaries
+        """
+        categories = categories or cls.CATEGORIES
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async with BrowserPool(pool_size=min(max_concurrency, len(categories))) as pool:
+            
+            async def scrape_region(region_code):
+                async with semaphore:
+                    scraper = cls(region_code=region_code, backend=backend)
+                    return await scraper.scrape_region(categories[region_code], max_products, pool)
+            
+            results = await asyncio.gather(*[scrape_region(code) for code in categories])
+        
+        return dict(zip(categories, results))
+    
     def print_stats(self):
         """Print scraping statistics."""
         print(f"\n{'='*60}")
@@ -270,29 +817,36 @@ class HMScraper:
         print(f"Successful:        {self.stats['successes']}")
         print(f"Failed:            {self.stats['failures']}")
         print(f"Products Found:    {self.stats['products_found']}")
+        print(f"Fast-path Misses:  {self.stats['fast_path_misses']}")
         success_rate = (self.stats['successes'] / self.stats['requests'] * 100 
                        if self.stats['requests'] > 0 else 0)
         print(f"Success Rate:      {success_rate:.1f}%")
         print(f"{'='*60}\n")
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/scraper.log'),
-        logging.StreamHandler()
-    ]
-)
+# Configure logging: scraper code only enqueues records, a background
+# listener thread does the file/console writes off the scraping path.
+# Skipped if the importing application has already configured logging.
+if not logging.getLogger().handlers:
+    os.makedirs('logs', exist_ok=True)
+    _log_queue = queue.Queue(-1)
+    _log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    _log_handlers = [logging.FileHandler('logs/scraper.log'), logging.StreamHandler()]
+    for _handler in _log_handlers:
+        _handler.setFormatter(_log_formatter)
+    _log_listener = QueueListener(_log_queue, *_log_handlers)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    logging.basicConfig(
+        level=os.environ.get('LOGLEVEL', 'INFO').upper(),  # LOGLEVEL=WARNING for a quiet run
+        format='%(message)s',  # Full format is applied by the listener's handlers
+        handlers=[QueueHandler(_log_queue)]
+    )
 
 
 if __name__ == "__main__":
     """Test the scraper with Playwright."""
     
-    import os
-    os.makedirs('logs', exist_ok=True)
-    
     print("\n" + "="*70)
     print("H&M Global Scraper Test (Playwright)")
     print("="*70 + "\n")
@@ -306,7 +860,7 @@ if __name__ == "__main__":
     
     # Test category scraping
     category = '/kadin/urunler/elbiseler.html'
-    products = scraper.scrape_category(category, max_products=5)
+    products = asyncio.run(scraper.scrape_category(category, max_products=5))
     
     if products:
         print(f"\n✅ Successfully scraped {len(products)} products")
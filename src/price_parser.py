@@ -0,0 +1,45 @@
+"""
+Price label parsing shared by every scrape path.
+
+Kept free of browser/HTTP imports so it can be tested on its own.
+"""
+
+import functools
+import math
+import re
+
+# Everything except digits and separators (currency symbols/text, whitespace)
+_PRICE_JUNK = re.compile(r'[^\d.,]')
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_price(price_text, decimal_sep, thousands_sep):
+    """
+    Parse a price label with known separators; NaN if it is not a valid price.
+    
+    Listing pages repeat a small set of labels ("299,99 TL", "$29.99"),
+    so results are memoized and repeats cost a dict lookup.
+    
+    A label written in the other convention ("29.99 €" for a region using
+    a decimal comma) is rejected rather than read as 2999: thousands
+    groups must be exactly three digits.
+    """
+    # Keep only digits and separators ("1.299,99 TL" -> "1.299,99")
+    cleaned = _PRICE_JUNK.sub('', price_text)
+    
+    # Split at the region's decimal separator; anything but digits after it
+    # (a second separator) makes int() fail below
+    integer_part, _, fraction = cleaned.partition(decimal_sep)
+    
+    groups = integer_part.split(thousands_sep)
+    if len(groups) > 1 and (not 1 <= len(groups[0]) <= 3
+                            or any(len(group) != 3 for group in groups[1:])):
+        return math.nan
+    
+    # Let int() scan the digits in C: "1.299,99" -> 129999 / 10**2
+    try:
+        value = int(''.join(groups) + fraction)
+    except ValueError:
+        return math.nan
+    
+    return value / 10 ** len(fraction)
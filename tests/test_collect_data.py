@@ -0,0 +1,103 @@
+import sqlite3
+
+import pytest
+
+import collect_data
+import database
+
+
+class FlatRateConverter:
+    def convert_to_usd(self, amount, currency):
+        return amount
+
+
+def make_item(i):
+    return {
+        'product_code': f'{i:07d}001',
+        'product_name': f'Dress {i}',
+        'price_local': 10.0 + i,
+        'currency': 'EUR',
+        'region_code': 'de',
+    }
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, 'DB_PATH', str(tmp_path / 'hm_global.db'))
+    database.init_db()
+    return database.DB_PATH
+
+
+@pytest.fixture
+def conn(db_path):
+    conn = database.get_connection(isolation_level=None)
+    yield conn
+    conn.close()
+
+
+@pytest.mark.parametrize('n_rows, n_statements', [(100, 1), (101, 2), (250, 3)])
+def test_insert_rows_chunks_at_insert_chunk_rows(conn, n_rows, n_statements):
+    statements = []
+    conn.set_trace_callback(statements.append)
+    rows = [(f'{i:07d}001', 'de', 10.0, 'EUR', 10.0) for i in range(n_rows)]
+    
+    collect_data.insert_rows(
+        conn.cursor(),
+        "INSERT INTO prices (article_code, region, price_original, currency, price_in_usd)",
+        rows
+    )
+    
+    conn.set_trace_callback(None)
+    inserts = [s for s in statements if s.startswith('INSERT')]
+    assert len(inserts) == n_statements
+    assert conn.execute("SELECT COUNT(*) FROM prices").fetchone()[0] == n_rows
+
+
+def test_insert_rows_with_no_rows_executes_nothing(conn):
+    statements = []
+    conn.set_trace_callback(statements.append)
+    
+    collect_data.insert_rows(conn.cursor(), "INSERT INTO prices (article_code)", [])
+    
+    assert statements == []
+
+
+def test_save_data_stores_products_and_prices(conn):
+    items = [make_item(i) for i in range(3)] + [make_item(0)]
+    
+    collect_data.save_data(items, conn, FlatRateConverter())
+    
+    assert conn.execute("SELECT COUNT(*) FROM products").fetchone()[0] == 3
+    assert conn.execute("SELECT COUNT(*) FROM prices").fetchone()[0] == 4
+    assert not conn.in_transaction
+
+
+def test_save_data_with_empty_batch(conn):
+    collect_data.save_data([], conn, FlatRateConverter())
+    
+    assert conn.execute("SELECT COUNT(*) FROM prices").fetchone()[0] == 0
+    assert not conn.in_transaction
+
+
+def test_save_data_surfaces_begin_failure_instead_of_rollback_error(db_path):
+    blocker = database.get_connection(isolation_level=None)
+    blocker.execute("BEGIN IMMEDIATE")
+    conn = database.get_connection(isolation_level=None, timeout=0)
+    try:
+        with pytest.raises(sqlite3.OperationalError, match='database is locked'):
+            collect_data.save_data([make_item(1)], conn, FlatRateConverter())
+        assert not conn.in_transaction
+    finally:
+        blocker.execute("ROLLBACK")
+        blocker.close()
+        conn.close()
+
+
+def test_save_data_rolls_back_failed_insert(conn):
+    conn.execute("DROP TABLE prices")
+    
+    with pytest.raises(sqlite3.OperationalError, match='no such table'):
+        collect_data.save_data([make_item(1)], conn, FlatRateConverter())
+    
+    assert not conn.in_transaction
+    assert conn.execute("SELECT COUNT(*) FROM products").fetchone()[0] == 0
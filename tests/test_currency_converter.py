@@ -0,0 +1,65 @@
+import json
+
+import httpx
+import pytest
+
+import currency_converter
+from currency_converter import CurrencyConverter, FX_FALLBACK_TTL
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    path = tmp_path / 'fx_cache.json'
+    monkeypatch.setattr(currency_converter, 'FX_CACHE_PATH', str(path))
+    return path
+
+
+def stub_api(monkeypatch, payload):
+    """Replace httpx.get with a stub returning `payload`; returns the call log."""
+    calls = []
+    
+    def get(url, **kwargs):
+        calls.append(url)
+        return httpx.Response(200, json=payload, request=httpx.Request('GET', url))
+    
+    monkeypatch.setattr(currency_converter.httpx, 'get', get)
+    return calls
+
+
+def test_live_rates_are_inverted_and_cached_for_the_day(cache_path, monkeypatch):
+    calls = stub_api(monkeypatch, {'rates': {'TRY': 32.0, 'EUR': 0.8, 'GBP': 0.5, 'SEK': 10.0}})
+    
+    converter = CurrencyConverter()
+    CurrencyConverter()
+    
+    assert len(calls) == 1
+    assert converter.rates['EUR'] == pytest.approx(1.25)
+    assert converter.convert_to_usd(100, 'SEK') == pytest.approx(10.0)
+    assert json.loads(cache_path.read_text())['fallback'] is False
+
+
+def test_fallback_rates_are_cached_then_retried_after_ttl(cache_path, monkeypatch):
+    # exchangerate.host's reply without an access key
+    calls = stub_api(monkeypatch, {'success': False, 'error': {'code': 101}})
+    now = 1_000_000.0
+    monkeypatch.setattr(currency_converter.time, 'time', lambda: now)
+    
+    converters = [CurrencyConverter() for _ in range(3)]
+    
+    assert len(calls) == 1
+    assert converters[-1].rates == converters[-1].fallback_rates
+    assert json.loads(cache_path.read_text())['fallback'] is True
+    
+    now += FX_FALLBACK_TTL - 1
+    CurrencyConverter()
+    assert len(calls) == 1
+    
+    now += 2
+    CurrencyConverter()
+    assert len(calls) == 2
+
+
+def test_unknown_currency_converts_to_zero(cache_path, monkeypatch):
+    stub_api(monkeypatch, {'success': False})
+    
+    assert CurrencyConverter().convert_to_usd(100, 'XYZ') == 0
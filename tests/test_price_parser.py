@@ -0,0 +1,41 @@
+import math
+
+import pytest
+
+from price_parser import parse_price
+
+# (decimal, thousands) as in HMScraper._SEPARATORS
+COMMA_DECIMAL = (',', '.')   # tr, de, se
+POINT_DECIMAL = ('.', ',')   # us, uk
+
+
+@pytest.mark.parametrize('price_text, separators, expected', [
+    ('299,99 TL', COMMA_DECIMAL, 299.99),
+    ('1.299,99 TL', COMMA_DECIMAL, 1299.99),
+    ('29,99 €', COMMA_DECIMAL, 29.99),
+    ('1.234.567,50 €', COMMA_DECIMAL, 1234567.5),
+    ('249 kr', COMMA_DECIMAL, 249.0),
+    ('1 299,00 kr', COMMA_DECIMAL, 1299.0),
+    ('$29.99', POINT_DECIMAL, 29.99),
+    ('$1,299.99', POINT_DECIMAL, 1299.99),
+    ('£29.99', POINT_DECIMAL, 29.99),
+    ('£15', POINT_DECIMAL, 15.0),
+])
+def test_parses_regional_formats(price_text, separators, expected):
+    assert parse_price(price_text, *separators) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('price_text, separators', [
+    # Other region's convention must not become a 100x price
+    ('29.99 €', COMMA_DECIMAL),
+    ('29,99', POINT_DECIMAL),
+    # Malformed thousands groups or repeated decimal separators
+    ('1.29,99 TL', COMMA_DECIMAL),
+    ('1299.999,00 TL', COMMA_DECIMAL),
+    ('$1.299.99', POINT_DECIMAL),
+    # No number at all
+    ('Sold out', POINT_DECIMAL),
+    ('', COMMA_DECIMAL),
+])
+def test_rejects_invalid_labels(price_text, separators):
+    assert math.isnan(parse_price(price_text, *separators))